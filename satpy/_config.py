@@ -43,6 +43,7 @@ PACKAGE_CONFIG_PATH = os.path.join(BASE_PATH, "etc")
 _satpy_dirs = AppDirs(appname="satpy", appauthor="pytroll")
 _CONFIG_DEFAULTS = {
     "tmp_dir": tempfile.gettempdir(),
+    "angles_numba": False,
     "cache_dir": _satpy_dirs.user_cache_dir,
     "cache_lonlats": False,
     "cache_sensor_angles": False,
@@ -20,25 +20,38 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
+import math
 import os
 import shutil
+import struct
 import warnings
+import weakref
 from functools import update_wrapper
-from glob import glob
 from typing import Any, Callable, Optional, Union
 
 import dask
 import numpy as np
 import xarray as xr
 from dask import array as da
-from pyorbital.astronomy import cos_zen as pyob_cos_zen
-from pyorbital.astronomy import get_alt_az
+from pyorbital.astronomy import gmst as pyob_gmst
+from pyorbital.astronomy import observer_position as pyob_observer_position
+from pyorbital.astronomy import sun_ra_dec as pyob_sun_ra_dec
 from pyorbital.orbital import get_observer_look
 from pyresample.geometry import AreaDefinition, StackedAreaDefinition, SwathDefinition
 
 import satpy
 from satpy.utils import PerformanceWarning, get_satpos, ignore_invalid_float_warnings
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
 PRGeometry = Union[SwathDefinition, AreaDefinition, StackedAreaDefinition]
 
 # Arbitrary time used when computing sensor angles that is passed to
@@ -48,6 +61,9 @@ PRGeometry = Union[SwathDefinition, AreaDefinition, StackedAreaDefinition]
 STATIC_EARTH_INERTIAL_DATETIME = dt.datetime(2000, 1, 1, 12, 0, 0)
 DEFAULT_UNCACHE_TYPES = (SwathDefinition, xr.DataArray, da.Array)
 HASHABLE_GEOMETRIES = (AreaDefinition, StackedAreaDefinition)
+# WGS84 constants matching those used by pyorbital
+_EARTH_EQUATORIAL_RADIUS_KM = 6378.137
+_EARTH_FLATTENING = 1 / 298.257223563
 
 
 class ZarrCacheHelper:
@@ -120,6 +136,8 @@ class ZarrCacheHelper:
         self._uncacheable_arg_types = uncacheable_arg_types
         self._sanitize_args_func = sanitize_args_func
         self._cache_version = cache_version
+        self._memory_cache: dict = {}
+        self._num_outputs: Optional[int] = None
 
     def cache_clear(self, cache_dir: Optional[str] = None):
         """Remove all on-disk files associated with this function.
@@ -127,14 +145,14 @@ class ZarrCacheHelper:
         Intended to mimic the :func:`functools.cache` behavior.
         """
         cache_dir = self._get_cache_dir_from_config(cache_dir)
-        zarr_pattern = self._zarr_pattern("*", cache_version="*").format("*")
-        for zarr_dir in glob(os.path.join(cache_dir, zarr_pattern)):
+        for zarr_dir in _list_cached_zarr_paths(cache_dir, f"{self._func.__name__}_v", ".zarr"):
             shutil.rmtree(zarr_dir, ignore_errors=True)
+        self._memory_cache.clear()
 
-    def _zarr_pattern(self, arg_hash, cache_version: Union[None, int, str] = None) -> str:
+    def _zarr_filename(self, arg_hash, cache_version: Union[None, int, str] = None) -> str:
         if cache_version is None:
             cache_version = self._cache_version
-        return f"{self._func.__name__}_v{cache_version}" + "_{}_" + f"{arg_hash}.zarr"
+        return f"{self._func.__name__}_v{cache_version}_{arg_hash}.zarr"
 
     def __call__(self, *args, cache_dir: Optional[str] = None) -> Any:
         """Call the decorated function."""
@@ -151,31 +169,54 @@ class ZarrCacheHelper:
     def _cache_and_read(self, args, cache_dir):
         sanitized_args = self._sanitize_args_func(*args) if self._sanitize_args_func is not None else args
 
-        zarr_file_pattern = self._get_zarr_file_pattern(sanitized_args, cache_dir)
-        zarr_paths = glob(zarr_file_pattern.format("*"))
+        zarr_path = self._get_zarr_path(sanitized_args, cache_dir)
+        new_chunks = _get_output_chunks_from_func_arguments(args)
+        memory_cache_key = (zarr_path, new_chunks)
+        try:
+            # dask arrays are cheap lazy handles so they can be shared between
+            # calls in the same process without re-reading the zarr store
+            return self._memory_cache[memory_cache_key]
+        except KeyError:
+            pass
 
-        if not zarr_paths:
+        if not os.path.isdir(zarr_path):
             # use sanitized arguments
             self._warn_if_irregular_input_chunks(args, sanitized_args)
             res_to_cache = self._func(*(sanitized_args))
-            self._cache_results(res_to_cache, zarr_file_pattern)
-
-        # if we did any caching, let's load from the zarr files, so that future calls have the same name
-        # re-calculate the cached paths
-        zarr_paths = sorted(glob(zarr_file_pattern.format("*")))
-        if not zarr_paths:
-            raise RuntimeError("Data was cached to disk but no files were found")
-
-        new_chunks = _get_output_chunks_from_func_arguments(args)
-        res = tuple(da.from_zarr(zarr_path, chunks=new_chunks) for zarr_path in zarr_paths)
+            self._cache_results(res_to_cache, zarr_path)
+        res = tuple(da.from_zarr(zarr_path, component=component, chunks=new_chunks)
+                    for component in self._cached_components(zarr_path))
+        # the decorated function always produces the same number of outputs,
+        # so future cache hits can skip listing the group contents
+        self._num_outputs = len(res)
+        self._store_in_memory_cache(memory_cache_key, res)
         return res
 
-    def _get_zarr_file_pattern(self, sanitized_args, cache_dir):
+    def _store_in_memory_cache(self, memory_cache_key, res, max_entries: int = 128):
+        while len(self._memory_cache) >= max_entries:
+            self._memory_cache.pop(next(iter(self._memory_cache)))
+        self._memory_cache[memory_cache_key] = res
+
+    def _get_zarr_path(self, sanitized_args, cache_dir):
         arg_hash = _hash_args(*sanitized_args, unhashable_types=self._uncacheable_arg_types)
-        zarr_filename = self._zarr_pattern(arg_hash)
+        zarr_filename = self._zarr_filename(arg_hash)
         cache_dir = self._get_cache_dir_from_config(cache_dir)
         return os.path.join(cache_dir, zarr_filename)
 
+    def _cached_components(self, zarr_path: str) -> list[str]:
+        """List the per-output sub-arrays stored in a cached zarr group.
+
+        Once the number of outputs of the decorated function is known the
+        component names are generated directly since they are simply the
+        output indexes; the group contents only need to be listed for the
+        first hit in a process.
+        """
+        if self._num_outputs is not None:
+            return [str(idx) for idx in range(self._num_outputs)]
+        import zarr
+        group = zarr.open_group(zarr_path, mode="r")
+        return sorted(group.array_keys(), key=int)
+
     @staticmethod
     def _get_cache_dir_from_config(cache_dir: Optional[str]) -> str:
         cache_dir = cache_dir or satpy.config.get("cache_dir")
@@ -197,20 +238,75 @@ class ZarrCacheHelper:
                 stacklevel=3
             )
 
-    def _cache_results(self, res, zarr_file_pattern):
-        os.makedirs(os.path.dirname(zarr_file_pattern), exist_ok=True)
+    def _cache_results(self, res, zarr_path) -> None:
+        """Create the on-disk zarr store for all outputs of the decorated function.
+
+        All outputs are written as sub-arrays of a single zarr group so a
+        cache entry costs one directory and one set of metadata instead of
+        one store per output. The group is written under a temporary name
+        and only renamed into place once every chunk has been stored, so a
+        partially written entry (e.g. from an interrupted process) can
+        never be mistaken for a complete one by the existence check.
+        """
+        import numcodecs
+        os.makedirs(os.path.dirname(zarr_path), exist_ok=True)
+        tmp_zarr_path = f"{zarr_path}.{os.getpid()}.tmp"
         new_res = []
-        for idx, sub_res in enumerate(res):
-            if not isinstance(sub_res, da.Array):
-                raise ValueError("Zarr caching currently only supports dask "
-                                 f"arrays. Got {type(sub_res)}")
-            zarr_path = zarr_file_pattern.format(idx)
-            # See https://github.com/dask/dask/issues/8380
-            with dask.config.set({"optimization.fuse.active": False}):
-                new_sub_res = sub_res.to_zarr(zarr_path, compute=False)
-            new_res.append(new_sub_res)
-        # actually compute the storage to zarr
-        da.compute(new_res)
+        # See https://github.com/dask/dask/issues/8380
+        # entered once around the whole loop so every output's store graph
+        # is built and computed under the same dask configuration
+        with dask.config.set({"optimization.fuse.active": False}):
+            for idx, sub_res in enumerate(res):
+                if not isinstance(sub_res, da.Array):
+                    raise ValueError("Zarr caching currently only supports dask "
+                                     f"arrays. Got {type(sub_res)}")
+                store_kwargs = self._zarr_store_kwargs(sub_res, numcodecs)
+                new_sub_res = sub_res.to_zarr(tmp_zarr_path, component=str(idx),
+                                              compute=False, **store_kwargs)
+                new_res.append(new_sub_res)
+            da.compute(new_res)
+        try:
+            os.rename(tmp_zarr_path, zarr_path)
+        except OSError:
+            # another process finished writing the same entry first
+            if not os.path.isdir(zarr_path):
+                raise
+            shutil.rmtree(tmp_zarr_path, ignore_errors=True)
+        self._num_outputs = len(res)
+
+    @staticmethod
+    def _zarr_store_kwargs(sub_res: da.Array, numcodecs) -> dict:
+        """Get creation options for the on-disk zarr arrays.
+
+        Bit-shuffled Zstd compresses the smooth geolocation and angle arrays
+        being cached noticeably better than the default compressor at a
+        similar speed, and chunks consisting entirely of the fill value
+        (e.g. space pixels outside a geostationary disk) are not written at
+        all.
+        """
+        store_kwargs: dict = {
+            "compressor": numcodecs.Blosc(cname="zstd", clevel=1, shuffle=numcodecs.Blosc.BITSHUFFLE),
+            "write_empty_chunks": False,
+        }
+        if np.issubdtype(sub_res.dtype, np.floating):
+            store_kwargs["fill_value"] = np.nan
+        return store_kwargs
+
+
+def _list_cached_zarr_paths(cache_dir: str, prefix: str, suffix: str) -> list[str]:
+    """List on-disk zarr stores whose names match the given prefix and suffix.
+
+    A single :func:`os.scandir` pass with plain string checks is used instead
+    of :func:`glob.glob`, which would walk and pattern match every entry of
+    the cache directory on each call.
+    """
+    try:
+        dir_entries = os.scandir(cache_dir)
+    except FileNotFoundError:
+        return []
+    with dir_entries:
+        return [dir_entry.path for dir_entry in dir_entries
+                if dir_entry.name.startswith(prefix) and dir_entry.name.endswith(suffix)]
 
 
 def _get_output_chunks_from_func_arguments(args):
@@ -233,6 +329,7 @@ def cache_to_zarr_if(
         cache_config_key: str,
         uncacheable_arg_types=DEFAULT_UNCACHE_TYPES,
         sanitize_args_func: Optional[Callable] = None,
+        cache_version: int = 1,
 ) -> Callable:
     """Decorate a function and cache the results as a zarr array on disk.
 
@@ -248,7 +345,8 @@ def cache_to_zarr_if(
         zarr_cacher = ZarrCacheHelper(func,
                                       cache_config_key,
                                       uncacheable_arg_types,
-                                      sanitize_args_func)
+                                      sanitize_args_func,
+                                      cache_version)
         wrapper = update_wrapper(zarr_cacher, func)
         return wrapper
 
@@ -256,37 +354,120 @@ def cache_to_zarr_if(
 
 
 def _hash_args(*args, unhashable_types=DEFAULT_UNCACHE_TYPES):
-    import json
-    hashable_args = []
+    payload = bytearray()
     for arg in args:
         if isinstance(arg, unhashable_types):
             raise TypeError(f"Unhashable type ({type(arg)}).")
         if isinstance(arg, HASHABLE_GEOMETRIES):
-            arg = hash(arg)
+            arg = _hash_geometry(arg)
         elif isinstance(arg, dt.datetime):
             arg = arg.isoformat(" ")
-        hashable_args.append(arg)
-    arg_hash = hashlib.sha1()  # nosec
-    arg_hash.update(json.dumps(tuple(hashable_args)).encode("utf8"))
-    return arg_hash.hexdigest()
+        _pack_arg_bytes(payload, arg)
+    return _hash_bytes(bytes(payload))
+
+
+def _pack_arg_bytes(payload: bytearray, arg: Any) -> None:
+    """Append a compact, type-tagged byte representation of an argument.
+
+    The hashed arguments are small fixed-shape tuples of numbers and short
+    strings, for which packing with :mod:`struct` is several times faster
+    than serializing through ``json.dumps``. Each value is prefixed with a
+    type tag so, e.g., ``1`` and ``1.0`` or ``(1, 2)`` and ``(1, (2,))``
+    cannot pack to the same bytes.
+    """
+    if isinstance(arg, (int, np.integer)) and not isinstance(arg, bool):
+        payload += b"i" + struct.pack("<q", arg)
+    elif isinstance(arg, (float, np.floating)):
+        payload += b"f" + struct.pack("<d", arg)
+    elif isinstance(arg, str):
+        encoded_arg = arg.encode("utf8")
+        payload += b"s" + struct.pack("<I", len(encoded_arg)) + encoded_arg
+    elif isinstance(arg, (tuple, list)):
+        payload += b"t" + struct.pack("<I", len(arg))
+        for sub_arg in arg:
+            _pack_arg_bytes(payload, sub_arg)
+    elif arg is None or isinstance(arg, bool):
+        payload += b"c" + str(arg).encode("utf8")
+    else:
+        raise TypeError(f"Unhashable type ({type(arg)}).")
+
+
+_geometry_hash_cache: dict[int, int] = {}
+
+
+def _hash_geometry(geometry) -> int:
+    """Get ``hash(geometry)`` with memoization keyed on object identity.
+
+    Hashing an :class:`~pyresample.geometry.AreaDefinition` walks its
+    projection parameters and extents, which adds up when the same area
+    is hashed for every cached angle call in a scene. Entries are evicted
+    when the geometry object is garbage collected so a re-used object id
+    can never resolve to a stale hash.
+    """
+    cache_key = id(geometry)
+    try:
+        return _geometry_hash_cache[cache_key]
+    except KeyError:
+        pass
+    geometry_hash = hash(geometry)
+    try:
+        weakref.finalize(geometry, _geometry_hash_cache.pop, cache_key, None)
+    except TypeError:
+        return geometry_hash
+    _geometry_hash_cache[cache_key] = geometry_hash
+    return geometry_hash
+
+
+def _hash_bytes(payload: bytes) -> str:
+    """Hash a small payload into a hex digest to be used as a cache key.
+
+    The digest is purely an identity for cache entries, not a security
+    primitive, so a fast non-cryptographic hash is preferred when available.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _identity(arg: Any) -> Any:
+    return arg
+
+
+def _round_float_arg(arg) -> float:
+    # Round floating point numbers to nearest tenth and cast numpy scalars
+    # to plain floats so similar positions hash to the same cache key:
+    return float(round(arg, 1))
+
+
+def _regularize_chunk_tuple_arg(arg: tuple) -> tuple:
+    if _is_chunk_tuple(arg) and _chunks_are_irregular(arg):
+        return _regular_chunks_from_irregular_chunks(arg)
+    return arg
+
+
+# Exact-type dispatch table so sanitizing each argument on this per-call
+# path costs one dict lookup instead of a chain of isinstance checks.
+_OBSERVER_LOOK_ARG_SANITIZERS: dict = {
+    dt.datetime: lambda arg: STATIC_EARTH_INERTIAL_DATETIME,
+    float: _round_float_arg,
+    np.float64: _round_float_arg,
+    np.float32: _round_float_arg,
+    tuple: _regularize_chunk_tuple_arg,
+}
 
 
 def _sanitize_observer_look_args(*args):
-    new_args = []
-    for arg in args:
-        if isinstance(arg, dt.datetime):
-            new_args.append(STATIC_EARTH_INERTIAL_DATETIME)
-        elif isinstance(arg, (float, np.float64, np.float32)):
-            # Round floating point numbers to nearest tenth. Numpy types don't
-            # serialize into JSON which is needed for hashing, thus the casting
-            # to float here:
-            new_args.append(float(round(arg, 1)))
-        elif _is_chunk_tuple(arg) and _chunks_are_irregular(arg):
-            new_chunks = _regular_chunks_from_irregular_chunks(arg)
-            new_args.append(new_chunks)
-        else:
-            new_args.append(arg)
-    return new_args
+    return [_sanitize_observer_look_arg(arg) for arg in args]
+
+
+def _sanitize_observer_look_arg(arg: Any) -> Any:
+    sanitizer = _OBSERVER_LOOK_ARG_SANITIZERS.get(type(arg))
+    if sanitizer is not None:
+        return sanitizer(arg)
+    if isinstance(arg, dt.datetime):
+        # datetime subclasses (e.g. pandas.Timestamp) miss the exact-type dispatch
+        return STATIC_EARTH_INERTIAL_DATETIME
+    return arg
 
 
 def _sanitize_args_with_chunks(*args):
@@ -376,8 +557,10 @@ def get_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray, xr.D
         Solar angles are provided in the [-180, 180] degree range.
 
     """
-    sata, satz = _get_sensor_angles(data_arr)
-    suna, sunz = _get_sun_angles(data_arr)
+    chunks = _geo_chunks_from_data_arr(data_arr)
+    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
+    sata, satz = _get_sensor_angles(data_arr, lons, lats)
+    suna, sunz = _get_sun_angles_from_lonlats(lons, lats, data_arr.attrs["start_time"])
     return sata, satz, suna, sunz
 
 
@@ -410,66 +593,188 @@ def get_cos_sza(data_arr: xr.DataArray) -> xr.DataArray:
     return _geo_dask_to_data_array(cos_sza)
 
 
-@cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
+_lonlat_array_cache: dict[tuple, tuple[da.Array, da.Array]] = {}
+
+
+def _memoize_lonlats_per_area(func: Callable) -> Callable:
+    """Share lon/lat dask arrays per area object within a process.
+
+    A single Scene can request the coordinates of the same area many times
+    across modifiers and compositors, each time rebuilding the same dask
+    graph through ``area.get_lonlats``. Since the returned dask arrays are
+    lazy and never mutated they can be shared between callers, so the most
+    recently used pairs are kept regardless of the ``cache_lonlats``
+    on-disk caching setting. Entries are evicted when the area object is
+    garbage collected so a re-used object id can never resolve to stale
+    arrays.
+    """
+    def wrapper(area: PRGeometry, chunks: Union[int, str, tuple] = "auto") -> tuple[da.Array, da.Array]:
+        cache_key = (id(area), chunks)
+        try:
+            hash(cache_key)
+        except TypeError:
+            # unhashable chunk specification (e.g. a list of chunk sizes)
+            return func(area, chunks)
+        try:
+            return _lonlat_array_cache[cache_key]
+        except KeyError:
+            pass
+        lonlats = func(area, chunks)
+        try:
+            weakref.finalize(area, _lonlat_array_cache.pop, cache_key, None)
+        except TypeError:
+            return lonlats
+        while len(_lonlat_array_cache) >= 8:
+            _lonlat_array_cache.pop(next(iter(_lonlat_array_cache)))
+        _lonlat_array_cache[cache_key] = lonlats
+        return lonlats
+
+    def cache_clear(cache_dir: Optional[str] = None) -> None:
+        """Clear the in-process lon/lat arrays and the on-disk zarr entries."""
+        _lonlat_array_cache.clear()
+        func.cache_clear(cache_dir)
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@_memoize_lonlats_per_area
+@cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks, cache_version=2)
 def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto") -> tuple[da.Array, da.Array]:
     with ignore_invalid_float_warnings():
-        # NOTE: This defaults to 64-bit floats due to needed precision for X/Y coordinates
-        lons, lats = area.get_lonlats(chunks=chunks)
-        lons = da.where(lons >= 1e30, np.nan, lons)
-        lats = da.where(lats >= 1e30, np.nan, lats)
-    return lons, lats
+        # NOTE: Single precision (~1e-5 degrees) is plenty for the angle
+        # computations these coordinates feed and it halves the memory
+        # traffic and on-disk cache size of these large arrays.
+        lons, lats = area.get_lonlats(chunks=chunks, dtype=np.float32)
+        if lons.npartitions == 1 and lons.size < 1_000_000:
+            # for a single small chunk the dask scheduling overhead dominates
+            # the actual work, so compute and mask eagerly with numpy
+            lons_np, lats_np = da.compute(lons, lats)
+            masked = _mask_invalid_lonlats_ndarray(lons_np, lats_np)
+            return (da.from_array(masked[0], chunks=lons_np.shape),
+                    da.from_array(masked[1], chunks=lats_np.shape))
+        res = da.map_blocks(_mask_invalid_lonlats_ndarray, lons, lats,
+                            dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
+                            new_axis=[0], chunks=(2,) + lons.chunks)
+    return res[0], res[1]
 
 
-def _get_sun_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
-    chunks = _geo_chunks_from_data_arr(data_arr)
-    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
-    suna = da.map_blocks(_get_sun_azimuth_ndarray, lons, lats,
-                         data_arr.attrs["start_time"],
-                         dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
-                         chunks=lons.chunks)
-    cos_sza = _get_cos_sza(data_arr.attrs["start_time"], lons, lats)
-    sunz = np.rad2deg(np.arccos(cos_sza))
-    suna = _geo_dask_to_data_array(suna)
-    sunz = _geo_dask_to_data_array(sunz)
+def _mask_invalid_lonlats_ndarray(lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """Replace fill values in the lon and lat arrays with NaN in a single block pass."""
+    with ignore_invalid_float_warnings():
+        out = np.empty((2,) + lons.shape, dtype=lons.dtype)
+        np.copyto(out[0], lons)
+        np.copyto(out[1], lats)
+        out[0][lons >= 1e30] = np.nan
+        out[1][lats >= 1e30] = np.nan
+    return out
+
+
+def _get_sun_angles_from_lonlats(lons: da.Array, lats: da.Array,
+                                 start_time: dt.datetime) -> tuple[xr.DataArray, xr.DataArray]:
+    # resolve the scalar solar position terms once instead of per chunk
+    sun_ra, sun_dec, gmst_rad = _sun_scalar_params(start_time)
+    res = da.map_blocks(_get_sun_angles_ndarray, lons, lats,
+                        sun_ra, sun_dec, gmst_rad,
+                        dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
+                        new_axis=[0], chunks=(2,) + lons.chunks)
+    suna = _geo_dask_to_data_array(res[0])
+    sunz = _geo_dask_to_data_array(res[1])
     return suna, sunz
 
 
 def _get_cos_sza(utc_time, lons, lats):
+    # resolve the scalar solar position terms once instead of per chunk
+    sun_ra, sun_dec, gmst_rad = _sun_scalar_params(utc_time)
     cos_sza = da.map_blocks(_cos_zen_ndarray,
-                            lons, lats, utc_time,
+                            lons, lats, sun_ra, sun_dec, gmst_rad,
                             meta=np.array((), dtype=lons.dtype),
                             dtype=lons.dtype,
                             chunks=lons.chunks)
     return cos_sza
 
 
-def _cos_zen_ndarray(lons, lats, utc_time):
-    with ignore_invalid_float_warnings():
-        return pyob_cos_zen(utc_time, lons, lats)
-
+def _cos_zen_ndarray(lons: np.ndarray, lats: np.ndarray,
+                     sun_ra: float, sun_dec: float, gmst_rad: float) -> np.ndarray:
+    """Compute the cosine of the solar zenith angle from precomputed solar position terms.
 
-def _get_sun_azimuth_ndarray(lons: np.ndarray, lats: np.ndarray, start_time: dt.datetime) -> np.ndarray:
+    This is the same formula evaluated by pyorbital's ``cos_zen`` but with
+    the per-timestep scalars (solar right ascension and declination,
+    sidereal time) resolved once outside the per-chunk calls instead of
+    being rederived from the datetime for every block.
+    """
+    if np.isnan(lons).all():
+        # whole block is off-Earth pixels (e.g. space around a full disk)
+        return np.full(lons.shape, np.nan, dtype=lons.dtype)
+    if _use_numba_angles():
+        return _cos_zen_kernel(lons, lats, sun_ra, sun_dec, gmst_rad)
     with ignore_invalid_float_warnings():
-        suna = get_alt_az(start_time, lons, lats)[1]
-        suna = np.rad2deg(suna)
-
-        # The get_alt_az function returns values in the range -180 to 180 degrees.
-        # Satpy expects values in the 0 - 360 range, which is what is returned for the
-        # satellite azimuth angles.
+        # intermediate math in 64-bit floats like pyorbital, casting back to
+        # the lon/lat dtype only on output
+        lats_rad = np.deg2rad(lats, dtype=np.float64)
+        hour_angle = gmst_rad + np.deg2rad(lons, dtype=np.float64) - sun_ra
+        cos_zen = (np.sin(lats_rad) * math.sin(sun_dec) +
+                   np.cos(lats_rad) * math.cos(sun_dec) * np.cos(hour_angle))
+    return cos_zen.astype(lons.dtype, copy=False)
+
+
+def _get_sun_angles_ndarray(lons: np.ndarray, lats: np.ndarray,
+                            sun_ra: float, sun_dec: float, gmst_rad: float) -> np.ndarray:
+    """Compute solar azimuth and zenith angles from precomputed solar position terms.
+
+    This evaluates the same formulas as pyorbital's ``get_alt_az`` but takes
+    the per-timestep scalars (solar right ascension and declination, sidereal
+    time) resolved once outside the per-chunk calls, and derives the zenith
+    angle from the same hour angle intermediates as the azimuth in a single
+    pass.
+    """
+    if np.isnan(lons).all():
+        # whole block is off-Earth pixels (e.g. space around a full disk)
+        return np.full((2,) + lons.shape, np.nan, dtype=lons.dtype)
+    if _use_numba_angles():
+        return _sun_angles_kernel(lons, lats, sun_ra, sun_dec, gmst_rad)
+    with ignore_invalid_float_warnings():
+        # intermediate math in 64-bit floats like pyorbital, casting back to
+        # the lon/lat dtype only on output
+        lats_rad = np.deg2rad(lats, dtype=np.float64)
+        sin_lat = np.sin(lats_rad)
+        cos_lat = np.cos(lats_rad)
+        hour_angle = gmst_rad + np.deg2rad(lons, dtype=np.float64) - sun_ra
+        cos_ha = np.cos(hour_angle)
+        azi_rad = np.arctan2(-np.sin(hour_angle),
+                             cos_lat * math.tan(sun_dec) - sin_lat * cos_ha)
+        alt_rad = np.arcsin(sin_lat * math.sin(sun_dec) + cos_lat * math.cos(sun_dec) * cos_ha)
+        # fill a single preallocated output so the block cost is one
+        # allocation with any dtype cast done during assignment instead of a
+        # stack copy followed by an astype copy
+        out = np.empty((2,) + lons.shape, dtype=lons.dtype)
+
+        # The azimuth values are in the range -180 to 180 degrees. Satpy
+        # expects values in the 0 - 360 range, which is what is returned for
+        # the satellite azimuth angles.
         # Here this is corrected so both sun and sat azimuths are in the same range.
-        suna = suna % 360.
-    return suna
+        out[0] = np.rad2deg(azi_rad) % 360.
+        out[1] = 90 - np.rad2deg(alt_rad)
+    return out
 
 
-def _get_sensor_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
+def _get_sensor_angles(data_arr: xr.DataArray,
+                       lons: Optional[da.Array] = None,
+                       lats: Optional[da.Array] = None) -> tuple[xr.DataArray, xr.DataArray]:
     preference = satpy.config.get("sensor_angles_position_preference", "actual")
     sat_lon, sat_lat, sat_alt = get_satpos(data_arr, preference=preference)
-    area_def = data_arr.attrs["area"]
-    chunks = _geo_chunks_from_data_arr(data_arr)
 
-    sata, satz = _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt,
-                                                 data_arr.attrs["start_time"],
-                                                 area_def, chunks)
+    if lons is None or satpy.config.get("cache_sensor_angles", False):
+        # the cached function needs hashable arguments, so it generates its
+        # own lon/lat arrays from the area and chunks
+        area_def = data_arr.attrs["area"]
+        chunks = _geo_chunks_from_data_arr(data_arr)
+        sata, satz = _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt,
+                                                     data_arr.attrs["start_time"],
+                                                     area_def, chunks)
+    else:
+        sata, satz = _get_sensor_angles_from_lonlats_and_pos(lons, lats, sat_lon, sat_lat, sat_alt,
+                                                             data_arr.attrs["start_time"])
     sata = _geo_dask_to_data_array(sata)
     satz = _geo_dask_to_data_array(satz)
     return sata, satz
@@ -489,9 +794,13 @@ def _dim_index_with_default(dims: tuple, dim_name: str, default: int) -> int:
         return default
 
 
-@cache_to_zarr_if("cache_sensor_angles", sanitize_args_func=_sanitize_observer_look_args)
+@cache_to_zarr_if("cache_sensor_angles", sanitize_args_func=_sanitize_observer_look_args, cache_version=2)
 def _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt, start_time, area_def, chunks):
     lons, lats = _get_valid_lonlats(area_def, chunks)
+    return _get_sensor_angles_from_lonlats_and_pos(lons, lats, sat_lon, sat_lat, sat_alt, start_time)
+
+
+def _get_sensor_angles_from_lonlats_and_pos(lons, lats, sat_lon, sat_lat, sat_alt, start_time):
     res = da.map_blocks(_get_sensor_angles_ndarray, lons, lats, start_time, sat_lon, sat_lat, sat_alt,
                         dtype=lons.dtype, meta=np.array((), dtype=lons.dtype), new_axis=[0],
                         chunks=(2,) + lons.chunks)
@@ -499,6 +808,11 @@ def _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt, start_time, area_
 
 
 def _get_sensor_angles_ndarray(lons, lats, start_time, sat_lon, sat_lat, sat_alt) -> np.ndarray:
+    if np.isnan(lons).all():
+        # whole block is off-Earth pixels (e.g. space around a full disk)
+        return np.full((2,) + lons.shape, np.nan, dtype=lons.dtype)
+    if _use_numba_angles():
+        return _observer_look_numba(lons, lats, start_time, sat_lon, sat_lat, sat_alt / 1000.0)
     with ignore_invalid_float_warnings():
         sata, satel = get_observer_look(
             sat_lon,
@@ -506,8 +820,113 @@ def _get_sensor_angles_ndarray(lons, lats, start_time, sat_lon, sat_lat, sat_alt
             sat_alt / 1000.0,  # km
             start_time,
             lons, lats, 0)
-        satz = 90 - satel
-        return np.stack([sata, satz])
+        out = np.empty((2,) + lons.shape, dtype=lons.dtype)
+        out[0] = sata
+        out[1] = 90 - satel
+        return out
+
+
+def _use_numba_angles() -> bool:
+    """Determine if the optional numba-accelerated angle kernels should be used."""
+    return njit is not None and satpy.config.get("angles_numba", False)
+
+
+def _sun_scalar_params(utc_time: dt.datetime) -> tuple[float, float, float]:
+    """Compute the per-timestep scalar terms shared by all pixels of the solar angle kernels."""
+    sun_ra, sun_dec = pyob_sun_ra_dec(utc_time)
+    return float(sun_ra), float(sun_dec), float(pyob_gmst(utc_time))
+
+
+def _observer_look_numba(lons: np.ndarray, lats: np.ndarray, start_time: dt.datetime,
+                         sat_lon: float, sat_lat: float, sat_alt_km: float) -> np.ndarray:
+    (sat_x, sat_y, sat_z), _ = pyob_observer_position(start_time, sat_lon, sat_lat, sat_alt_km)
+    gmst_rad = float(pyob_gmst(start_time))
+    return _observer_look_kernel(lons, lats, float(sat_x), float(sat_y), float(sat_z), gmst_rad)
+
+
+if njit is not None:
+    # Pure floating point reimplementations of the pyorbital formulas used
+    # above. Only the per-pixel math is compiled; the per-timestep scalar
+    # terms (solar position, satellite position, sidereal time) are computed
+    # once with pyorbital and passed in as scalars. NaN inputs (space pixels)
+    # propagate to NaN outputs, which is why ``fastmath`` is not used.
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _cos_zen_kernel(lons, lats, sun_ra, sun_dec, gmst_rad):  # pragma: no cover
+        out = np.empty_like(lons)
+        flat_lons = lons.ravel()
+        flat_lats = lats.ravel()
+        flat_out = out.ravel()
+        sin_dec = math.sin(sun_dec)
+        cos_dec = math.cos(sun_dec)
+        for idx in prange(flat_lons.size):
+            lon_rad = math.radians(flat_lons[idx])
+            lat_rad = math.radians(flat_lats[idx])
+            hour_angle = gmst_rad + lon_rad - sun_ra
+            flat_out[idx] = (math.sin(lat_rad) * sin_dec +
+                             math.cos(lat_rad) * cos_dec * math.cos(hour_angle))
+        return out
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _sun_angles_kernel(lons, lats, sun_ra, sun_dec, gmst_rad):  # pragma: no cover
+        out = np.empty((2,) + lons.shape, dtype=lons.dtype)
+        flat_lons = lons.ravel()
+        flat_lats = lats.ravel()
+        flat_azi = out[0].ravel()
+        flat_zen = out[1].ravel()
+        sin_dec = math.sin(sun_dec)
+        cos_dec = math.cos(sun_dec)
+        tan_dec = math.tan(sun_dec)
+        for idx in prange(flat_lons.size):
+            lon_rad = math.radians(flat_lons[idx])
+            lat_rad = math.radians(flat_lats[idx])
+            sin_lat = math.sin(lat_rad)
+            cos_lat = math.cos(lat_rad)
+            hour_angle = gmst_rad + lon_rad - sun_ra
+            cos_ha = math.cos(hour_angle)
+            azi_rad = math.atan2(-math.sin(hour_angle),
+                                 cos_lat * tan_dec - sin_lat * cos_ha)
+            alt_rad = math.asin(sin_lat * sin_dec + cos_lat * cos_dec * cos_ha)
+            flat_azi[idx] = math.degrees(azi_rad) % 360.0
+            flat_zen[idx] = 90.0 - math.degrees(alt_rad)
+        return out
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _observer_look_kernel(lons, lats, sat_x, sat_y, sat_z, gmst_rad):  # pragma: no cover
+        out = np.empty((2,) + lons.shape, dtype=lons.dtype)
+        flat_lons = lons.ravel()
+        flat_lats = lats.ravel()
+        flat_azi = out[0].ravel()
+        flat_zen = out[1].ravel()
+        for idx in prange(flat_lons.size):
+            lon_rad = math.radians(flat_lons[idx])
+            lat_rad = math.radians(flat_lats[idx])
+            theta = (gmst_rad + lon_rad) % (2 * math.pi)
+            sin_lat = math.sin(lat_rad)
+            cos_lat = math.cos(lat_rad)
+            sin_theta = math.sin(theta)
+            cos_theta = math.cos(theta)
+            c__ = 1.0 / math.sqrt(1.0 + _EARTH_FLATTENING * (_EARTH_FLATTENING - 2.0) * sin_lat * sin_lat)
+            sq__ = c__ * (1.0 - _EARTH_FLATTENING) ** 2
+            achcp = _EARTH_EQUATORIAL_RADIUS_KM * c__ * cos_lat
+            rx_ = sat_x - achcp * cos_theta
+            ry_ = sat_y - achcp * sin_theta
+            rz_ = sat_z - _EARTH_EQUATORIAL_RADIUS_KM * sq__ * sin_lat
+            top_s = sin_lat * cos_theta * rx_ + sin_lat * sin_theta * ry_ - cos_lat * rz_
+            top_e = -sin_theta * rx_ + cos_theta * ry_
+            top_z = cos_lat * cos_theta * rx_ + cos_lat * sin_theta * ry_ + sin_lat * rz_
+            azi_rad = (math.atan2(-top_e, top_s) + math.pi) % (2 * math.pi)
+            rg_ = math.sqrt(rx_ * rx_ + ry_ * ry_ + rz_ * rz_)
+            # rounding can push the ratio just past 1 near the sub-satellite point
+            el_arg = top_z / rg_
+            if el_arg > 1.0:
+                el_arg = 1.0
+            elif el_arg < -1.0:
+                el_arg = -1.0
+            el_rad = math.asin(el_arg)
+            flat_azi[idx] = math.degrees(azi_rad)
+            flat_zen[idx] = 90.0 - math.degrees(el_rad)
+        return out
 
 
 def sunzen_corr_cos(data: da.Array,
@@ -15,7 +15,6 @@
 
 """Tests for the angles in modifiers."""
 
-import contextlib
 import datetime as dt
 import warnings
 from copy import deepcopy
@@ -122,20 +121,6 @@ def _diff_sat_pos_datetime(orig_data):
     return _similar_sat_pos_datetime(orig_data, lon_offset=0.05)
 
 
-def _glob_reversed(pat):
-    """Behave like glob but force results to be in the wrong order."""
-    return sorted(glob(pat), reverse=True)
-
-
-@contextlib.contextmanager
-def _mock_glob_if(mock_glob):
-    if mock_glob:
-        with mock.patch("satpy.modifiers.angles.glob", _glob_reversed):
-            yield
-    else:
-        yield
-
-
 def _assert_allclose_if(expect_equal, arr1, arr2):
     if not expect_equal:
         pytest.raises(AssertionError, np.testing.assert_allclose, arr1, arr2)
@@ -216,13 +201,12 @@ class TestAngleGeneration:
             # nadir 2
             gol.assert_any_call(9.1, 0.02, 12345.679, input_data1.attrs["start_time"], mock.ANY, mock.ANY, 0)
 
-    @pytest.mark.parametrize("force_bad_glob", [False, True])
     @pytest.mark.parametrize(
         ("input2_func", "exp_equal_sun", "exp_num_zarr"),
         [
-            (lambda x: x, True, 4),
-            (_similar_sat_pos_datetime, False, 4),
-            (_diff_sat_pos_datetime, False, 6),
+            (lambda x: x, True, 2),
+            (_similar_sat_pos_datetime, False, 2),
+            (_diff_sat_pos_datetime, False, 3),
         ]
     )
     @pytest.mark.parametrize(
@@ -239,13 +223,13 @@ class TestAngleGeneration:
             self,
             input_func, num_normalized_chunks, exp_zarr_chunks,
             input2_func, exp_equal_sun, exp_num_zarr,
-            force_bad_glob, tmp_path):
+            tmp_path):
         """Test get_angles when caching is enabled."""
         from satpy.modifiers.angles import STATIC_EARTH_INERTIAL_DATETIME, get_angles
 
         # Patch methods
         data = input_func()
-        additional_cache = exp_num_zarr > 4
+        additional_cache = exp_num_zarr > 2
 
         # Compute angles
         from pyorbital.orbital import get_observer_look
@@ -257,8 +241,7 @@ class TestAngleGeneration:
 
             # call again, should be cached
             new_data = input2_func(data)
-            with _mock_glob_if(force_bad_glob):
-                res2 = get_angles(new_data)
+            res2 = get_angles(new_data)
             self._check_cached_result(res2, exp_zarr_chunks)
 
             res_numpy, res2_numpy = da.compute(res, res2)
@@ -291,13 +274,25 @@ class TestAngleGeneration:
     def _check_cache_and_clear(tmp_path, exp_num_zarr):
         from satpy.modifiers.angles import _get_sensor_angles_from_sat_pos, _get_valid_lonlats
         zarr_dirs = glob(str(tmp_path / "*.zarr"))
-        assert len(zarr_dirs) == exp_num_zarr  # two for lon/lat, one for sata, one for satz
+        assert len(zarr_dirs) == exp_num_zarr  # one group for lon/lats, one group per sensor angle set
 
         _get_valid_lonlats.cache_clear()
         _get_sensor_angles_from_sat_pos.cache_clear()
         zarr_dirs = glob(str(tmp_path / "*.zarr"))
         assert len(zarr_dirs) == 0
 
+    def test_cached_arrays_reused_in_process(self, tmp_path):
+        """Test that a second call in the same process reuses the same dask arrays."""
+        from satpy.modifiers.angles import _get_valid_lonlats
+        area = _angle_cache_area_def()
+        chunks = ((2, 2, 1), (2, 2, 1))
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path)):
+            lons1, lats1 = _get_valid_lonlats(area, chunks)
+            lons2, lats2 = _get_valid_lonlats(area, chunks)
+            assert lons1 is lons2
+            assert lats1 is lats2
+            _get_valid_lonlats.cache_clear()
+
     def test_cached_no_chunks_fails(self, tmp_path):
         """Test that trying to pass non-dask arrays and no chunks fails."""
         from satpy.modifiers.angles import _sanitize_args_with_chunks, cache_to_zarr_if
@@ -371,17 +366,51 @@ class TestAngleGeneration:
         assert isinstance(raa, xr.DataArray)
         np.testing.assert_allclose(expected_raa, raa)
 
+    def test_get_angles_float32(self):
+        """Test that generated angles are single precision floats."""
+        from satpy.modifiers.angles import get_angles
+        data = _get_angle_test_data()
+        angles = get_angles(data)
+        assert all(angle.dtype == np.float32 for angle in angles)
+
+    def test_numba_angle_kernels_match_pyorbital(self):
+        """Test that the optional numba kernels match the pyorbital implementations."""
+        pytest.importorskip("numba")
+        from satpy.modifiers.angles import (
+            _cos_zen_ndarray,
+            _get_sensor_angles_ndarray,
+            _get_sun_angles_ndarray,
+            _sun_scalar_params,
+        )
+
+        lons = np.array([[-80.0, 40.0], [0.0, np.nan]])
+        lats = np.array([[-40.0, 70.0], [0.0, np.nan]])
+        date = dt.datetime(2022, 1, 5, 12, 50, 0)
+        sun_params = _sun_scalar_params(date)
+
+        ref_cos_zen = _cos_zen_ndarray(lons, lats, *sun_params)
+        ref_sun = _get_sun_angles_ndarray(lons, lats, *sun_params)
+        ref_sensor = _get_sensor_angles_ndarray(lons, lats, date, 10.0, 0.0, 12345678.0)
+        with satpy.config.set(angles_numba=True):
+            numba_cos_zen = _cos_zen_ndarray(lons, lats, *sun_params)
+            numba_sun = _get_sun_angles_ndarray(lons, lats, *sun_params)
+            numba_sensor = _get_sensor_angles_ndarray(lons, lats, date, 10.0, 0.0, 12345678.0)
+
+        np.testing.assert_allclose(numba_cos_zen, ref_cos_zen)
+        np.testing.assert_allclose(numba_sun, ref_sun)
+        np.testing.assert_allclose(numba_sensor, ref_sensor)
+
     @pytest.mark.parametrize("dtype", [np.float32, np.float64])
     def test_solazi_correction(self, dtype):
         """Test that solar azimuth angles are corrected into the right range."""
-        from satpy.modifiers.angles import _get_sun_azimuth_ndarray
+        from satpy.modifiers.angles import _get_sun_angles_ndarray, _sun_scalar_params
 
         lats = np.array([-80, 40, 0, 40, 80], dtype=dtype)
         lons = np.array([-80, 40, 0, 40, 80], dtype=dtype)
 
         date = dt.datetime(2022, 1, 5, 12, 50, 0)
 
-        azi = _get_sun_azimuth_ndarray(lats, lons, date)
+        azi = _get_sun_angles_ndarray(lats, lons, *_sun_scalar_params(date))[0]
 
         assert np.all(azi > 0)
         assert azi.dtype == dtype